@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from apexdevkit.http import HttpUrl
 
 
-@dataclass
+@dataclass(slots=True)
 class RestfulName:
     singular: str
 
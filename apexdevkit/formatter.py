@@ -3,11 +3,11 @@ from __future__ import annotations
 import pickle
 from copy import deepcopy
 from dataclasses import asdict, dataclass, field, fields, is_dataclass
+from functools import cached_property
 from typing import Any, Generic, Protocol, Self, TypeVar, get_args
 
 from typing_extensions import get_type_hints
 
-from apexdevkit.fluent import FluentDict
 from apexdevkit.value import Value
 
 _SourceT = TypeVar("_SourceT")
@@ -56,13 +56,10 @@ class DataclassFormatter(Generic[_TargetT]):
         return self
 
     def load(self, raw: dict[str, Any]) -> _TargetT:
-        raw = FluentDict[Any](deepcopy(raw)).select(
-            *self.resource.__annotations__.keys()
-        )
+        annotations = self.resource.__annotations__
+        raw = deepcopy({k: v for k, v in raw.items() if k in annotations})
 
         for key in fields(self.resource):  # type: ignore
-            types = get_type_hints(self.resource)
-            key_type = types[key.name]
             if key.name not in raw:
                 continue
             elif key.name in self.sub_formatters.keys():
@@ -71,24 +68,41 @@ class DataclassFormatter(Generic[_TargetT]):
                     if raw[key.name]
                     else raw[key.name]
                 )
-            elif is_dataclass(key_type):
-                raw[key.name] = DataclassFormatter(key_type).load(raw[key.name])  # type: ignore
-            else:
-                args = get_args(key_type)
-                if len(args) == 1 and is_dataclass(args[0]):
-                    raw[key.name] = ListFormatter(DataclassFormatter(args[0])).load(  # type: ignore
-                        raw[key.name]
-                    )
+            elif key.name in self._nested:
+                raw[key.name] = self._nested[key.name].load(raw[key.name])
 
         return self.resource(**raw)
 
     def dump(self, item: _TargetT) -> dict[str, Any]:
         return asdict(item)  # type: ignore
 
+    @cached_property
+    def _types(self) -> dict[str, Any]:
+        return get_type_hints(self.resource)
+
+    @cached_property
+    def _nested(self) -> dict[str, Formatter[Any, Any]]:
+        nested: dict[str, Formatter[Any, Any]] = {}
+
+        for key in fields(self.resource):  # type: ignore
+            key_type = self._types[key.name]
+            if is_dataclass(key_type):
+                nested[key.name] = DataclassFormatter(key_type)  # type: ignore
+            else:
+                args = get_args(key_type)
+                if len(args) == 1 and is_dataclass(args[0]):
+                    nested[key.name] = ListFormatter(DataclassFormatter(args[0]))  # type: ignore
+
+        return nested
+
 
 class ValueFormatter:
     def load(self, raw: dict[str, Any]) -> Value:
-        return DataclassFormatter(Value).load(raw)
+        return self._formatter.load(raw)
 
     def dump(self, value: Value) -> dict[str, Any]:
-        return DataclassFormatter(Value).dump(value)
+        return self._formatter.dump(value)
+
+    @cached_property
+    def _formatter(self) -> DataclassFormatter[Value]:
+        return DataclassFormatter(Value)
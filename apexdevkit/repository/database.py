@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from copy import deepcopy
 from dataclasses import dataclass, field
 from typing import Any, ContextManager, Iterable, Protocol
 
@@ -81,11 +80,7 @@ class DatabaseCommand:
     ) -> DatabaseCommand:
         assert isinstance(self.payload, dict)
 
-        payload = deepcopy(self.payload)
-        payload.update(value or {})
-        payload.update(fields)
-
-        return DatabaseCommand(self.value, payload)
+        return DatabaseCommand(self.value, {**self.payload, **(value or {}), **fields})
 
     def with_collection(self, value: list[_RawData]) -> DatabaseCommand:
         return DatabaseCommand(self.value, value)
@@ -50,7 +50,7 @@ class InMemoryRepository(Generic[ItemT]):
         return InMemoryRepository(
             store=self.store,
             keys=self.keys,
-            seeds=self.seeds.union(set(items)),
+            seeds=self.seeds.union(items),
         )
 
     def build(self) -> Repository[ItemT]:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Any, Generic, Iterable, Iterator, TypeVar
 
 from pymssql.exceptions import DatabaseError
@@ -231,15 +232,61 @@ class DefaultSqlTable(SqlTable[ItemT]):
     username: str | None = None
 
     def count_all(self) -> DatabaseCommand:
-        return DatabaseCommand(f"""
+        return DatabaseCommand(self._count_all_query).with_data(
+            self.fields.with_fixed({})
+        )
+
+    def insert(self, item: ItemT) -> DatabaseCommand:
+        return DatabaseCommand(self._insert_query).with_data(
+            self.fields.with_fixed(self.formatter.dump(item))
+        )
+
+    def select(self, item_id: str) -> DatabaseCommand:
+        return DatabaseCommand(self._select_query).with_data(
+            self.fields.with_fixed({self.fields.id: item_id})
+        )
+
+    def select_all(self) -> DatabaseCommand:
+        return DatabaseCommand(self._select_all_query).with_data(
+            self.fields.with_fixed({})
+        )
+
+    def update(self, item: ItemT) -> DatabaseCommand:
+        return DatabaseCommand(self._update_query).with_data(
+            self.fields.with_fixed(self.formatter.dump(item))
+        )
+
+    def delete(self, item_id: str) -> DatabaseCommand:
+        return DatabaseCommand(self._delete_query).with_data(
+            self.fields.with_fixed({self.fields.id: item_id})
+        )
+
+    def delete_all(self) -> DatabaseCommand:
+        return DatabaseCommand(self._delete_all_query).with_data(
+            self.fields.with_fixed({})
+        )
+
+    def load(self, data: dict[str, Any]) -> ItemT:
+        return self.formatter.load(data)
+
+    def exists(self, duplicate: ItemT) -> ExistsError:
+        raw = self.formatter.dump(duplicate)
+        return ExistsError(duplicate).with_duplicate(
+            lambda i: f"{self.fields.id}<{raw[self.fields.id]}>"
+        )
+
+    @cached_property
+    def _count_all_query(self) -> str:
+        return f"""
             {self._user_check}
             SELECT count(*) AS n_items
             FROM [{self.schema}].[{self.table}]
             {self.fields.where_statement(include_id=False)}
             REVERT
-        """).with_data(self.fields.with_fixed({}))
+        """
 
-    def insert(self, item: ItemT) -> DatabaseCommand:
+    @cached_property
+    def _insert_query(self) -> str:
         columns = ", ".join(
             ["[" + field.name + "]" for field in self.fields if field.include_in_insert]
         )
@@ -261,7 +308,7 @@ class DefaultSqlTable(SqlTable[ItemT]):
             )
             where_statement = ""
 
-        return DatabaseCommand(f"""
+        return f"""
             {self._user_check}
             INSERT INTO [{self.schema}].[{self.table}] (
                 {columns}
@@ -273,24 +320,26 @@ class DefaultSqlTable(SqlTable[ItemT]):
                 {output}
             {where_statement}
             REVERT
-        """).with_data(self.fields.with_fixed(self.formatter.dump(item)))
+        """
 
-    def select(self, item_id: str) -> DatabaseCommand:
+    @cached_property
+    def _select_query(self) -> str:
         columns = ", ".join(["[" + field.name + "]" for field in self.fields])
 
-        return DatabaseCommand(f"""
+        return f"""
             {self._user_check}
             SELECT
                 {columns} 
             FROM [{self.schema}].[{self.table}]
             {self.fields.where_statement(include_id=True)}
             REVERT
-        """).with_data(self.fields.with_fixed({self.fields.id: item_id}))
+        """
 
-    def select_all(self) -> DatabaseCommand:
+    @cached_property
+    def _select_all_query(self) -> str:
         columns = ", ".join(["[" + field.name + "]" for field in self.fields])
 
-        return DatabaseCommand(f"""
+        return f"""
             {self._user_check}
             SELECT
                 {columns}
@@ -298,9 +347,10 @@ class DefaultSqlTable(SqlTable[ItemT]):
             {self.fields.where_statement(include_id=False)}
             {self.fields.order}
             REVERT
-        """).with_data(self.fields.with_fixed({}))
+        """
 
-    def update(self, item: ItemT) -> DatabaseCommand:
+    @cached_property
+    def _update_query(self) -> str:
         updates = ", ".join(
             [
                 f"{field.name} = %({field.name})s"
@@ -309,41 +359,34 @@ class DefaultSqlTable(SqlTable[ItemT]):
             ]
         )
 
-        return DatabaseCommand(f"""
+        return f"""
             {self._user_check}
             UPDATE [{self.schema}].[{self.table}]
             SET
                 {updates}
             {self.fields.where_statement(include_id=True)}
             REVERT
-        """).with_data(self.fields.with_fixed(self.formatter.dump(item)))
+        """
 
-    def delete(self, item_id: str) -> DatabaseCommand:
-        return DatabaseCommand(f"""
+    @cached_property
+    def _delete_query(self) -> str:
+        return f"""
             {self._user_check}
             DELETE
             FROM [{self.schema}].[{self.table}]
             {self.fields.where_statement(include_id=True)}
             REVERT
-        """).with_data(self.fields.with_fixed({self.fields.id: item_id}))
+        """
 
-    def delete_all(self) -> DatabaseCommand:
-        return DatabaseCommand(f"""
+    @cached_property
+    def _delete_all_query(self) -> str:
+        return f"""
             {self._user_check}
             DELETE
             FROM [{self.schema}].[{self.table}]
             {self.fields.where_statement(include_id=False)}
             REVERT
-        """).with_data(self.fields.with_fixed({}))
-
-    def load(self, data: dict[str, Any]) -> ItemT:
-        return self.formatter.load(data)
-
-    def exists(self, duplicate: ItemT) -> ExistsError:
-        raw = self.formatter.dump(duplicate)
-        return ExistsError(duplicate).with_duplicate(
-            lambda i: f"{self.fields.id}<{raw[self.fields.id]}>"
-        )
+        """
 
     @property
     def _user_check(self) -> str:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any, Iterator
 
 
@@ -155,7 +156,9 @@ class SqlFieldManager:
         else:
             return ""
 
-    def with_fixed(self, data: dict[str, Any]) -> dict[str, Any]:
+    @cached_property
+    def _fixed(self) -> dict[str, Any]:
+        data: dict[str, Any] = {}
         for key in self.fields:
             if key.is_parent:
                 data[key.name] = key.parent_value
@@ -163,26 +166,25 @@ class SqlFieldManager:
                 data[key.name] = key.fixed_value
         return data
 
+    def with_fixed(self, data: dict[str, Any]) -> dict[str, Any]:
+        return {**data, **self._fixed}
+
     def _parent_filter(self) -> str:
         result = next((key for key in self.fields if key.is_parent), None)
         if result is not None:
             if result.parent_value is None:
-                return self.key_formatter.replace("x", result.name) + " IS NULL"
+                return f"{self._key(result.name)} IS NULL"
             else:
-                return (
-                    self.key_formatter.replace("x", result.name)
-                    + " = "
-                    + self.value_formatter.replace("x", result.name)
-                )
+                return f"{self._key(result.name)} = {self._value(result.name)}"
         else:
             return ""
 
     def _id_filter(self, include_id: bool, read_id: bool) -> str:
         return (
-            self.key_formatter.replace("x", self.id)
+            self._key(self.id)
             + " = "
             + (
-                self.value_formatter.replace("x", self.id)
+                self._value(self.id)
                 if not read_id
                 or next(  # type: ignore
                     (key for key in self.fields if key.is_id), None
@@ -198,22 +200,22 @@ class SqlFieldManager:
         for key in self.fields:
             if key.is_filter:
                 if key.filter_value is None:
-                    statements.append(
-                        self.key_formatter.replace("x", key.name) + " IS NULL"
-                    )
+                    statements.append(f"{self._key(key.name)} IS NULL")
                 elif isinstance(key.filter_value, NotNone):
-                    statements.append(
-                        self.key_formatter.replace("x", key.name) + " IS NOT NULL"
-                    )
+                    statements.append(f"{self._key(key.name)} IS NOT NULL")
                 else:
                     statements.append(
-                        self.key_formatter.replace("x", key.name)
-                        + " = "
-                        + self.value_formatter.replace("x", key.name)
+                        f"{self._key(key.name)} = {self._value(key.name)}"
                     )
 
         return " AND ".join(statements)
 
+    def _key(self, name: str) -> str:
+        return self.key_formatter.replace("x", name, 1)
+
+    def _value(self, name: str) -> str:
+        return self.value_formatter.replace("x", name, 1)
+
     @dataclass
     class Builder:
         fields: list[_SqlField] = field(init=False)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
 from sqlite3 import IntegrityError
 from typing import Any, Generic, Iterable, Iterator
 
@@ -154,13 +155,68 @@ class _DefaultSqlTable(SqlTable[ItemT]):
     fields: SqlFieldManager
 
     def count_all(self) -> DatabaseCommand:
-        return DatabaseCommand(f"""
+        return DatabaseCommand(self._count_all_query).with_data(
+            self.fields.with_fixed({})
+        )
+
+    def insert(self, item: ItemT) -> DatabaseCommand:
+        return DatabaseCommand(self._insert_query).with_data(
+            self.fields.with_fixed(self.formatter.dump(item))
+        )
+
+    def select(self, item_id: str) -> DatabaseCommand:
+        return DatabaseCommand(self._select_query).with_data(
+            self.fields.with_fixed({self.fields.id: item_id})
+        )
+
+    def select_duplicate(self, item: ItemT) -> DatabaseCommand:
+        raw = self.formatter.dump(item)
+
+        return DatabaseCommand(self._select_duplicate_query).with_data(
+            {key: raw[key] for key in raw if key in self.fields.composite}
+        )
+
+    def select_all(self) -> DatabaseCommand:
+        return DatabaseCommand(self._select_all_query).with_data(
+            self.fields.with_fixed({})
+        )
+
+    def update(self, item: ItemT) -> DatabaseCommand:
+        return DatabaseCommand(self._update_query).with_data(
+            self.fields.with_fixed(self.formatter.dump(item))
+        )
+
+    def delete(self, item_id: str) -> DatabaseCommand:
+        return DatabaseCommand(self._delete_query).with_data(
+            self.fields.with_fixed({self.fields.id: item_id})
+        )
+
+    def delete_all(self) -> DatabaseCommand:
+        return DatabaseCommand(self._delete_all_query).with_data(
+            self.fields.with_fixed({})
+        )
+
+    def load(self, data: dict[str, Any]) -> ItemT:
+        return self.formatter.load(data)
+
+    def duplicate(self, item: ItemT) -> ExistsError:
+        raw = self.formatter.dump(item)
+        return ExistsError(item).with_duplicate(
+            lambda i: ",".join(
+                [f"{key}<{raw[key]}>" for key in raw if key in self.fields.composite]
+            )
+        )
+
+    @cached_property
+    def _count_all_query(self) -> str:
+        return f"""
             SELECT count(*) as n_items
             FROM {self.table_name.upper()}
             {self.fields.where_statement(include_id=False)};
-        """).with_data(self.fields.with_fixed({}))
+        """
 
-    def insert(self, item: ItemT) -> DatabaseCommand:
+    @cached_property
+    def _insert_query(self) -> str:
         insert_columns = ", ".join(
             [field.name for field in self.fields if field.include_in_insert]
         )
@@ -169,52 +225,55 @@ class _DefaultSqlTable(SqlTable[ItemT]):
             [f":{key.name}" for key in self.fields if key.include_in_insert]
         )
 
-        return DatabaseCommand(f"""
+        return f"""
             INSERT INTO {self.table_name.upper()} (
                 {insert_columns}
             ) VALUES (
                 {placeholders}
             )
             RETURNING {return_columns};
-        """).with_data(self.fields.with_fixed(self.formatter.dump(item)))
+        """
 
-    def select(self, item_id: str) -> DatabaseCommand:
+    @cached_property
+    def _select_query(self) -> str:
         columns = ", ".join([field.name for field in self.fields])
 
-        return DatabaseCommand(f"""
+        return f"""
             SELECT
                 {columns} 
             FROM {self.table_name.upper()}
             {self.fields.where_statement(include_id=True)};
-        """).with_data(self.fields.with_fixed({self.fields.id: item_id}))
+        """
 
-    def select_duplicate(self, item: ItemT) -> DatabaseCommand:
-        raw = self.formatter.dump(item)
+    @cached_property
+    def _select_duplicate_query(self) -> str:
         columns = ", ".join([field.name for field in self.fields])
 
         duplicates = " AND ".join(
             [f"{field} = :{field}" for field in self.fields.composite]
         )
 
-        return DatabaseCommand(f"""
+        return f"""
             SELECT
                 {columns} 
             FROM {self.table_name.upper()}
             WHERE {duplicates};
-        """).with_data({key: raw[key] for key in raw if key in self.fields.composite})
+        """
 
-    def select_all(self) -> DatabaseCommand:
+    @cached_property
+    def _select_all_query(self) -> str:
         columns = ", ".join([field.name for field in self.fields])
 
-        return DatabaseCommand(f"""
+        return f"""
             SELECT
                 {columns}
             FROM {self.table_name.capitalize()}
             {self.fields.where_statement(include_id=False)}
             {self.fields.order}
-        """).with_data(self.fields.with_fixed({}))
+        """
 
-    def update(self, item: ItemT) -> DatabaseCommand:
+    @cached_property
+    def _update_query(self) -> str:
         updates = ", ".join(
             [
                 f"{field.name} = :{field.name}"
@@ -223,34 +282,25 @@ class _DefaultSqlTable(SqlTable[ItemT]):
             ]
         )
 
-        return DatabaseCommand(f"""
+        return f"""
             UPDATE {self.table_name.upper()}
             SET
                 {updates}
             {self.fields.where_statement(include_id=True)};
-        """).with_data(self.fields.with_fixed(self.formatter.dump(item)))
+        """
 
-    def delete(self, item_id: str) -> DatabaseCommand:
-        return DatabaseCommand(f"""
+    @cached_property
+    def _delete_query(self) -> str:
+        return f"""
             DELETE
             FROM {self.table_name.upper()}
             {self.fields.where_statement(include_id=True)};
-        """).with_data(self.fields.with_fixed({self.fields.id: item_id}))
+        """
 
-    def delete_all(self) -> DatabaseCommand:
-        return DatabaseCommand(f"""
+    @cached_property
+    def _delete_all_query(self) -> str:
+        return f"""
             DELETE
             FROM {self.table_name.upper()}
             {self.fields.where_statement(include_id=False)};
-        """).with_data(self.fields.with_fixed({}))
-
-    def load(self, data: dict[str, Any]) -> ItemT:
-        return self.formatter.load(data)
-
-    def duplicate(self, item: ItemT) -> ExistsError:
-        raw = self.formatter.dump(item)
-        return ExistsError(item).with_duplicate(
-            lambda i: ",".join(
-                [f"{key}<{raw[key]}>" for key in raw if key in self.fields.composite]
-            )
-        )
+        """
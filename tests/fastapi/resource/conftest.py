@@ -1,24 +1,27 @@
+from typing import Iterator
+
 import pytest
 from starlette.testclient import TestClient
 
 from apexdevkit.fastapi import RestfulServiceBuilder
 from apexdevkit.fastapi.name import RestfulName
-from apexdevkit.http import Httpx
+from apexdevkit.http import Httpx, JsonDict
 from apexdevkit.testing import RestCollection
-from tests.fastapi.sample_api import setup
+from tests.fastapi.sample_api import FakeApple, setup
+
+
+@pytest.fixture(scope="session")
+def apple() -> JsonDict:
+    return FakeApple().json()
 
 
-@pytest.fixture
-def resource(service: RestfulServiceBuilder) -> RestCollection:
-    return RestCollection(
-        name=RestfulName("market-apple"),
-        http=Httpx(TestClient(setup(service))),
-    )
+@pytest.fixture(scope="module")
+def resource(service: RestfulServiceBuilder) -> Iterator[RestCollection]:
+    with TestClient(setup(service)) as client:
+        yield RestCollection(name=RestfulName("market-apple"), http=Httpx(client))
 
 
-@pytest.fixture
-def read_many_resource(service: RestfulServiceBuilder) -> RestCollection:
-    return RestCollection(
-        name=RestfulName("apple"),
-        http=Httpx(TestClient(setup(service))),
-    )
+@pytest.fixture(scope="module")
+def read_many_resource(service: RestfulServiceBuilder) -> Iterator[RestCollection]:
+    with TestClient(setup(service)) as client:
+        yield RestCollection(name=RestfulName("apple"), http=Httpx(client))
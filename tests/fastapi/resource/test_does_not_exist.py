@@ -1,19 +1,15 @@
-from uuid import uuid4
-
 import pytest
 
 from apexdevkit.error import DoesNotExistError
 from apexdevkit.http import JsonDict
 from apexdevkit.testing.rest import RestCollection
-from tests.fastapi.sample_api import FailingService, FakeApple
-
+from tests.fastapi.sample_api import FailingService
 
-@pytest.fixture
-def apple() -> JsonDict:
-    return FakeApple().json()
+_UNKNOWN_ID = "00000000-0000-4000-8000-000000000000"
+_MESSAGE = "An item<Market-apple> with id<unknown> does not exist."
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def service() -> FailingService:
     return FailingService(DoesNotExistError)
 
@@ -21,11 +17,11 @@ def service() -> FailingService:
 def test_should_not_read_unknown(resource: RestCollection) -> None:
     (
         resource.read_one()
-        .with_id(uuid4())
+        .with_id(_UNKNOWN_ID)
         .ensure()
         .fail()
         .with_code(404)
-        .and_message("An item<Market-apple> with id<unknown> does not exist.")
+        .and_message(_MESSAGE)
     )
 
 
@@ -37,7 +33,7 @@ def test_should_not_update_unknown(apple: JsonDict, resource: RestCollection) ->
         .ensure()
         .fail()
         .with_code(404)
-        .and_message("An item<Market-apple> with id<unknown> does not exist.")
+        .and_message(_MESSAGE)
     )
 
 
@@ -50,7 +46,7 @@ def test_should_not_update_many_unknown(
         .ensure()
         .fail()
         .with_code(404)
-        .and_message("An item<Market-apple> with id<unknown> does not exist.")
+        .and_message(_MESSAGE)
     )
 
 
@@ -61,7 +57,7 @@ def test_should_not_replace_unknown(apple: JsonDict, resource: RestCollection) -
         .ensure()
         .fail()
         .with_code(404)
-        .and_message("An item<Market-apple> with id<unknown> does not exist.")
+        .and_message(_MESSAGE)
     )
 
 
@@ -74,7 +70,7 @@ def test_should_not_replace_many_unknown(
         .ensure()
         .fail()
         .with_code(404)
-        .and_message("An item<Market-apple> with id<unknown> does not exist.")
+        .and_message(_MESSAGE)
     )
 
 
@@ -85,5 +81,5 @@ def test_should_not_delete_unknown(apple: JsonDict, resource: RestCollection) ->
         .ensure()
         .fail()
         .with_code(404)
-        .and_message("An item<Market-apple> with id<unknown> does not exist.")
+        .and_message(_MESSAGE)
     )
@@ -3,15 +3,12 @@ import pytest
 from apexdevkit.error import ExistsError
 from apexdevkit.http import JsonDict
 from apexdevkit.testing.rest import RestCollection
-from tests.fastapi.sample_api import FailingService, FakeApple
+from tests.fastapi.sample_api import FailingService
 
+_MESSAGE = "An item<Market-apple> with the  already exists."
 
-@pytest.fixture
-def apple() -> JsonDict:
-    return FakeApple().json()
 
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def service() -> FailingService:
     return FailingService(ExistsError)
 
@@ -23,7 +20,7 @@ def test_should_not_create_existing(apple: JsonDict, resource: RestCollection) -
         .ensure()
         .fail()
         .with_code(409)
-        .and_message("An item<Market-apple> with the  already exists.")
+        .and_message(_MESSAGE)
     )
 
 
@@ -36,5 +33,5 @@ def test_should_not_create_many_existing(
         .ensure()
         .fail()
         .with_code(409)
-        .and_message("An item<Market-apple> with the  already exists.")
+        .and_message(_MESSAGE)
     )
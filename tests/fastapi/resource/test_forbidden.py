@@ -1,19 +1,15 @@
-from uuid import uuid4
-
 import pytest
 
 from apexdevkit.error import ForbiddenError
 from apexdevkit.http import JsonDict
 from apexdevkit.testing.rest import RestCollection
-from tests.fastapi.sample_api import FailingService, FakeApple
-
+from tests.fastapi.sample_api import FailingService
 
-@pytest.fixture
-def apple() -> JsonDict:
-    return FakeApple().json()
+_UNKNOWN_ID = "00000000-0000-4000-8000-000000000000"
+_MESSAGE = "Forbidden"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def service() -> FailingService:
     return FailingService(ForbiddenError)
 
@@ -25,7 +21,7 @@ def test_should_not_create_forbidden(apple: JsonDict, resource: RestCollection)
         .ensure()
         .fail()
         .with_code(403)
-        .and_message("Forbidden")
+        .and_message(_MESSAGE)
     )
 
 
@@ -38,18 +34,18 @@ def test_should_not_create_many_forbidden(
         .ensure()
         .fail()
         .with_code(403)
-        .and_message("Forbidden")
+        .and_message(_MESSAGE)
     )
 
 
 def test_should_not_read_forbidden(resource: RestCollection) -> None:
     (
         resource.read_one()
-        .with_id(uuid4())
+        .with_id(_UNKNOWN_ID)
         .ensure()
         .fail()
         .with_code(403)
-        .and_message("Forbidden")
+        .and_message(_MESSAGE)
     )
 
 
@@ -71,14 +67,14 @@ def test_should_not_filter_forbidden(resource: RestCollection) -> None:
         .ensure()
         .fail()
         .with_code(403)
-        .and_message("Forbidden")
+        .and_message(_MESSAGE)
     )
 
 
 def test_should_not_read_many_forbidden(read_many_resource: RestCollection) -> None:
     read_many_resource.read_many(color="red").ensure().fail().with_code(
         403
-    ).and_message("Forbidden")
+    ).and_message(_MESSAGE)
 
 
 def test_should_not_read_aggregated_forbidden(
@@ -97,12 +93,12 @@ def test_should_not_read_aggregated_forbidden(
         .ensure()
         .fail()
         .with_code(403)
-        .and_message("Forbidden")
+        .and_message(_MESSAGE)
     )
 
 
 def test_should_not_read_all_forbidden(resource: RestCollection) -> None:
-    resource.read_all().ensure().fail().with_code(403).and_message("Forbidden")
+    resource.read_all().ensure().fail().with_code(403).and_message(_MESSAGE)
 
 
 def test_should_not_update_forbidden(apple: JsonDict, resource: RestCollection) -> None:
@@ -113,7 +109,7 @@ def test_should_not_update_forbidden(apple: JsonDict, resource: RestCollection)
         .ensure()
         .fail()
         .with_code(403)
-        .and_message("Forbidden")
+        .and_message(_MESSAGE)
     )
 
 
@@ -126,7 +122,7 @@ def test_should_not_update_many_forbidden(
         .ensure()
         .fail()
         .with_code(403)
-        .and_message("Forbidden")
+        .and_message(_MESSAGE)
     )
 
 
@@ -139,7 +135,7 @@ def test_should_not_replace_forbidden(
         .ensure()
         .fail()
         .with_code(403)
-        .and_message("Forbidden")
+        .and_message(_MESSAGE)
     )
 
 
@@ -152,7 +148,7 @@ def test_should_not_replace_many_forbidden(
         .ensure()
         .fail()
         .with_code(403)
-        .and_message("Forbidden")
+        .and_message(_MESSAGE)
     )
 
 
@@ -163,5 +159,5 @@ def test_should_not_delete_forbidden(apple: JsonDict, resource: RestCollection)
         .ensure()
         .fail()
         .with_code(403)
-        .and_message("Forbidden")
+        .and_message(_MESSAGE)
     )
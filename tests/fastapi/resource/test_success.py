@@ -19,19 +19,40 @@ from apexdevkit.query.query import (
     Sort,
 )
 from apexdevkit.testing import RestCollection
-from tests.fastapi.sample_api import FakeApple, SuccessfulService
-
-
-@pytest.fixture
-def apple() -> JsonDict:
-    return FakeApple().json()
+from tests.fastapi.sample_api import SuccessfulService
+
+_NOT_CALLED = object()
+_FILTER = JsonDict().with_a(args=[JsonDict().with_a(date="20221212")])
+_CONDITION = (
+    JsonDict()
+    .with_a(operation="NOT")
+    .and_a(operands=[JsonDict().with_a(name="test").and_a(values=[])])
+)
+_QUERY = (
+    JsonDict()
+    .with_a(filter=_FILTER)
+    .and_a(condition=_CONDITION)
+    .and_a(ordering=[JsonDict().with_a(name="test").and_a(is_descending=False)])
+    .and_a(paging=JsonDict().with_a(page=None).and_a(length=None).and_a(offset=None))
+)
+_FOOTER = (
+    JsonDict()
+    .with_a(filter=_FILTER)
+    .and_a(condition=_CONDITION)
+    .and_a(aggregations=[JsonDict().with_a(name=None).and_a(aggregation="COUNT")])
+)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def service(apple: JsonDict) -> SuccessfulService:
     return SuccessfulService(always_return=apple)
 
 
+@pytest.fixture(autouse=True)
+def reset(service: SuccessfulService) -> None:
+    service.called_with = _NOT_CALLED
+
+
 def test_should_create(
     apple: JsonDict,
     service: SuccessfulService,
@@ -106,22 +127,7 @@ def test_should_read_filtered(
 ) -> None:
     (
         resource.filter_with()
-        .from_data(
-            JsonDict()
-            .with_a(filter=JsonDict().with_a(args=[JsonDict().with_a(date="20221212")]))
-            .and_a(
-                condition=JsonDict()
-                .with_a(operation="NOT")
-                .and_a(operands=[JsonDict().with_a(name="test").and_a(values=[])])
-            )
-            .and_a(ordering=[JsonDict().with_a(name="test").and_a(is_descending=False)])
-            .and_a(
-                paging=JsonDict()
-                .with_a(page=None)
-                .and_a(length=None)
-                .and_a(offset=None)
-            )
-        )
+        .from_data(_QUERY)
         .ensure()
         .success()
         .with_code(200)
@@ -153,18 +159,7 @@ def test_should_read_aggregated(
 ) -> None:
     (
         resource.aggregate_with()
-        .from_data(
-            JsonDict()
-            .with_a(filter=JsonDict().with_a(args=[JsonDict().with_a(date="20221212")]))
-            .and_a(
-                condition=JsonDict()
-                .with_a(operation="NOT")
-                .and_a(operands=[JsonDict().with_a(name="test").and_a(values=[])])
-            )
-            .and_a(
-                aggregations=[JsonDict().with_a(name=None).and_a(aggregation="COUNT")]
-            )
-        )
+        .from_data(_FOOTER)
         .ensure()
         .success()
         .with_code(200)
@@ -192,7 +187,7 @@ def test_should_update_one(
         .with_code(200)
     )
 
-    assert service.called_with == (apple["id"], apple.drop("id").drop("color"))
+    assert service.called_with == (apple["id"], apple.drop("id", "color"))
 
 
 def test_should_update_many(
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Iterator
 
 import pytest
 from fastapi import FastAPI
@@ -11,14 +12,14 @@ from apexdevkit.fastapi.builder import RestfulServiceBuilder
 from apexdevkit.fastapi.dependable import DependableBuilder
 from apexdevkit.fastapi.name import RestfulName
 from apexdevkit.fastapi.router import RestfulRouter
-from apexdevkit.http import Httpx
+from apexdevkit.http import Httpx, JsonDict
 from apexdevkit.testing import RestCollection
-from tests.fastapi.sample_api import AppleFields, FakeApple, SuccessfulService
+from tests.fastapi.sample_api import AppleFields, SuccessfulService
 
 
 @pytest.fixture
-def infra() -> RestfulServiceBuilder:
-    return SuccessfulService(always_return=FakeApple().json())
+def infra(apple: JsonDict) -> RestfulServiceBuilder:
+    return SuccessfulService(always_return=apple)
 
 
 @pytest.fixture
@@ -27,11 +28,11 @@ def fake_user() -> FakeUser:
 
 
 @pytest.fixture
-def resource(infra: RestfulServiceBuilder, fake_user: FakeUser) -> RestCollection:
-    return RestCollection(
-        name=RestfulName("apple"),
-        http=Httpx(TestClient(setup(infra, fake_user))),
-    )
+def resource(
+    infra: RestfulServiceBuilder, fake_user: FakeUser
+) -> Iterator[RestCollection]:
+    with TestClient(setup(infra, fake_user)) as client:
+        yield RestCollection(name=RestfulName("apple"), http=Httpx(client))
 
 
 @dataclass
@@ -70,70 +71,49 @@ def setup(infra: RestfulServiceBuilder, fake_user: FakeUser) -> FastAPI:
 
 
 def test_should_call_extract_user_for_create_one(
-    resource: RestCollection, fake_user: FakeUser
+    apple: JsonDict, resource: RestCollection, fake_user: FakeUser
 ) -> None:
-    resource.create_one().from_data(FakeApple().json()).ensure()
+    resource.create_one().from_data(apple).ensure()
 
     assert fake_user.times_called == 1
 
 
 def test_should_persist_user_for_create_one(
-    resource: RestCollection,
-    infra: RestfulServiceBuilder,
+    apple: JsonDict, resource: RestCollection, infra: RestfulServiceBuilder
 ) -> None:
-    resource.create_one().from_data(FakeApple().json()).ensure()
+    resource.create_one().from_data(apple).ensure()
 
     assert infra.user == "user"
 
 
 def test_should_call_extract_user_for_create_many(
-    resource: RestCollection, fake_user: FakeUser
+    apple: JsonDict, resource: RestCollection, fake_user: FakeUser
 ) -> None:
-    (
-        resource.create_many()
-        .from_collection(
-            [
-                FakeApple().json(),
-                FakeApple().json(),
-            ]
-        )
-        .ensure()
-    )
+    resource.create_many().from_collection([apple, apple]).ensure()
 
     assert fake_user.times_called == 1
 
 
 def test_should_persist_user_for_create_many(
-    resource: RestCollection,
-    infra: RestfulServiceBuilder,
+    apple: JsonDict, resource: RestCollection, infra: RestfulServiceBuilder
 ) -> None:
-    (
-        resource.create_many()
-        .from_collection(
-            [
-                FakeApple().json(),
-                FakeApple().json(),
-            ]
-        )
-        .ensure()
-    )
+    resource.create_many().from_collection([apple, apple]).ensure()
 
     assert infra.user == "user"
 
 
 def test_should_call_extract_user_for_read_one(
-    resource: RestCollection, fake_user: FakeUser
+    apple: JsonDict, resource: RestCollection, fake_user: FakeUser
 ) -> None:
-    resource.read_one().with_id(str(FakeApple().json().get("id"))).ensure()
+    resource.read_one().with_id(apple["id"]).ensure()
 
     assert fake_user.times_called == 1
 
 
 def test_should_persist_user_for_read_one(
-    resource: RestCollection,
-    infra: RestfulServiceBuilder,
+    apple: JsonDict, resource: RestCollection, infra: RestfulServiceBuilder
 ) -> None:
-    resource.read_one().with_id(str(FakeApple().json().get("id"))).ensure()
+    resource.read_one().with_id(apple["id"]).ensure()
 
     assert infra.user == "user"
 
@@ -156,12 +136,12 @@ def test_should_persist_user_for_read_all(
 
 
 def test_should_call_extract_user_for_update_one(
-    resource: RestCollection, fake_user: FakeUser
+    apple: JsonDict, resource: RestCollection, fake_user: FakeUser
 ) -> None:
     (
         resource.update_one()
-        .with_id(str(FakeApple().json().get("id")))
-        .and_data(FakeApple().json().drop("id").drop("color"))
+        .with_id(apple["id"])
+        .and_data(apple.drop("id", "color"))
         .ensure()
     )
 
@@ -169,13 +149,12 @@ def test_should_call_extract_user_for_update_one(
 
 
 def test_should_persist_user_for_update_one(
-    resource: RestCollection,
-    infra: RestfulServiceBuilder,
+    apple: JsonDict, resource: RestCollection, infra: RestfulServiceBuilder
 ) -> None:
     (
         resource.update_one()
-        .with_id(str(FakeApple().json().get("id")))
-        .and_data(FakeApple().json().drop("id").drop("color"))
+        .with_id(apple["id"])
+        .and_data(apple.drop("id", "color"))
         .ensure()
     )
 
@@ -183,16 +162,11 @@ def test_should_persist_user_for_update_one(
 
 
 def test_should_call_extract_user_for_update_many(
-    resource: RestCollection, fake_user: FakeUser
+    apple: JsonDict, resource: RestCollection, fake_user: FakeUser
 ) -> None:
     (
         resource.update_many()
-        .from_collection(
-            [
-                FakeApple().json().drop("color"),
-                FakeApple().json().drop("color"),
-            ]
-        )
+        .from_collection([apple.drop("color"), apple.drop("color")])
         .ensure()
     )
 
@@ -200,17 +174,11 @@ def test_should_call_extract_user_for_update_many(
 
 
 def test_should_persist_user_for_update_many(
-    resource: RestCollection,
-    infra: RestfulServiceBuilder,
+    apple: JsonDict, resource: RestCollection, infra: RestfulServiceBuilder
 ) -> None:
     (
         resource.update_many()
-        .from_collection(
-            [
-                FakeApple().json().drop("color"),
-                FakeApple().json().drop("color"),
-            ]
-        )
+        .from_collection([apple.drop("color"), apple.drop("color")])
         .ensure()
     )
 
@@ -218,69 +186,48 @@ def test_should_persist_user_for_update_many(
 
 
 def test_should_call_extract_user_for_replace_one(
-    resource: RestCollection, fake_user: FakeUser
+    apple: JsonDict, resource: RestCollection, fake_user: FakeUser
 ) -> None:
-    resource.replace_one().from_data(FakeApple().json()).ensure()
+    resource.replace_one().from_data(apple).ensure()
 
     assert fake_user.times_called == 1
 
 
 def test_should_persist_user_for_replace_one(
-    resource: RestCollection,
-    infra: RestfulServiceBuilder,
+    apple: JsonDict, resource: RestCollection, infra: RestfulServiceBuilder
 ) -> None:
-    resource.replace_one().from_data(FakeApple().json()).ensure()
+    resource.replace_one().from_data(apple).ensure()
 
     assert infra.user == "user"
 
 
 def test_should_call_extract_user_for_replace_many(
-    resource: RestCollection, fake_user: FakeUser
+    apple: JsonDict, resource: RestCollection, fake_user: FakeUser
 ) -> None:
-    (
-        resource.replace_many()
-        .from_collection(
-            [
-                FakeApple().json(),
-                FakeApple().json(),
-            ]
-        )
-        .ensure()
-    )
+    resource.replace_many().from_collection([apple, apple]).ensure()
 
     assert fake_user.times_called == 1
 
 
 def test_should_persist_user_for_replace_many(
-    resource: RestCollection,
-    infra: RestfulServiceBuilder,
+    apple: JsonDict, resource: RestCollection, infra: RestfulServiceBuilder
 ) -> None:
-    (
-        resource.replace_many()
-        .from_collection(
-            [
-                FakeApple().json(),
-                FakeApple().json(),
-            ]
-        )
-        .ensure()
-    )
+    resource.replace_many().from_collection([apple, apple]).ensure()
 
     assert infra.user == "user"
 
 
 def test_should_call_extract_user_for_delete_one(
-    resource: RestCollection, fake_user: FakeUser
+    apple: JsonDict, resource: RestCollection, fake_user: FakeUser
 ) -> None:
-    resource.delete_one().with_id(str(FakeApple().json().get("id"))).ensure()
+    resource.delete_one().with_id(apple["id"]).ensure()
 
     assert fake_user.times_called == 1
 
 
 def test_should_persist_user_for_delete_one(
-    resource: RestCollection,
-    infra: RestfulServiceBuilder,
+    apple: JsonDict, resource: RestCollection, infra: RestfulServiceBuilder
 ) -> None:
-    resource.delete_one().with_id(str(FakeApple().json().get("id"))).ensure()
+    resource.delete_one().with_id(apple["id"]).ensure()
 
     assert infra.user == "user"
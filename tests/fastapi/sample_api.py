@@ -121,13 +121,16 @@ class Color(Enum):
     burgundy = "BURGUNDY"
 
 
-@dataclass(frozen=True)
+_COLOR_VALUES = tuple(color.value for color in Color)
+
+
+@dataclass(frozen=True, slots=True)
 class Name:
     common: str
     scientific: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Apple:
     id: str
     name: Name
@@ -135,23 +138,22 @@ class Apple:
 
 
 class AppleFields(SchemaFields):
+    NAME = JsonDict().with_a(common=str).and_a(scientific=str)
+    READABLE = JsonDict().with_a(id=str).and_a(name=NAME).and_a(color=str)
+    EDITABLE = JsonDict().with_a(name=NAME)
+
     def readable(self) -> JsonDict:
-        return (
-            JsonDict()
-            .with_a(id=str)
-            .and_a(name=JsonDict().with_a(common=str).and_a(scientific=str))
-            .and_a(color=str)
-        )
+        return self.READABLE
 
     def editable(self) -> JsonDict:
-        return JsonDict().with_a(
-            name=JsonDict().with_a(common=str).and_a(scientific=str)
-        )
+        return self.EDITABLE
 
 
 class PriceFields(SchemaFields):
+    READABLE = JsonDict().with_a(id=str).and_a(value=int)
+
     def readable(self) -> JsonDict:
-        return JsonDict().with_a(id=str).and_a(value=int)
+        return self.READABLE
 
 
 @dataclass(frozen=True)
@@ -165,7 +167,7 @@ class FakeApple(FakeResource[Apple]):
         return {
             "id": self.id or self.fake.uuid(),
             "name": self._name(),
-            "color": random.choice(list(Color)).value,
+            "color": random.choice(_COLOR_VALUES),
         }
 
     def _name(self) -> dict[str, Any]:
@@ -1,5 +1,4 @@
-from dataclasses import dataclass
-from functools import cached_property
+from dataclasses import dataclass, field
 from typing import Any, ContextManager
 from uuid import uuid4
 
@@ -22,12 +21,10 @@ class _Item:
 
 @dataclass
 class MongoMockConnector:
-    def connect(self) -> ContextManager[MongoClient[Any]]:
-        return self._client
+    client: MongoClient[Any] = field(default_factory=mongomock.MongoClient)
 
-    @cached_property
-    def _client(self) -> MongoClient[Any]:
-        return mongomock.MongoClient()
+    def connect(self) -> ContextManager[MongoClient[Any]]:
+        return self.client
 
 
 @pytest.fixture
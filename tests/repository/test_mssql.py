@@ -12,7 +12,7 @@ from apexdevkit.repository import Database, DatabaseCommand, MsSqlRepository
 from apexdevkit.repository.mssql import SqlTable, UnknownError
 
 
-@dataclass
+@dataclass(slots=True)
 class Apple:
     color: str
 
@@ -79,12 +79,27 @@ def apple() -> Apple:
     return Apple("red")
 
 
-def test_should_retrieve_all(apple: Apple) -> None:
+@fixture
+def table() -> AppleTable:
+    return AppleTable()
+
+
+@fixture
+def executor() -> MagicMock:
+    return MagicMock(spec=Database._CommandExecutor)
+
+
+@fixture
+def db(executor: MagicMock) -> MagicMock:
     db = MagicMock(spec=Database)
-    executor = MagicMock(spec=Database._CommandExecutor)
     db.execute.return_value = executor
-    table = AppleTable()
 
+    return db
+
+
+def test_should_retrieve_all(
+    db: MagicMock, executor: MagicMock, table: AppleTable, apple: Apple
+) -> None:
     executor.fetch_all.return_value = [table.dump(apple)]
     result = [item for item in MsSqlRepository[Apple](db, table)]
 
@@ -93,12 +108,9 @@ def test_should_retrieve_all(apple: Apple) -> None:
     assert result == [apple]
 
 
-def test_should_count_all() -> None:
-    db = MagicMock(spec=Database)
-    executor = MagicMock(spec=Database._CommandExecutor)
-    db.execute.return_value = executor
-    table = AppleTable()
-
+def test_should_count_all(
+    db: MagicMock, executor: MagicMock, table: AppleTable
+) -> None:
     executor.fetch_one.return_value = {"n_items": 1}
     result = len(MsSqlRepository[Apple](db, table))
 
@@ -107,48 +119,36 @@ def test_should_count_all() -> None:
     assert result == 1
 
 
-def test_should_not_count_all() -> None:
-    db = MagicMock(spec=Database)
-    executor = MagicMock(spec=Database._CommandExecutor)
-    db.execute.return_value = executor
-    table = AppleTable()
-
+def test_should_not_count_all(
+    db: MagicMock, executor: MagicMock, table: AppleTable
+) -> None:
     executor.fetch_one.return_value = {}
     with pytest.raises(UnknownError):
         len(MsSqlRepository[Apple](db, table))
 
 
-def test_should_delete(apple: Apple) -> None:
-    db = MagicMock(spec=Database)
-    executor = MagicMock(spec=Database._CommandExecutor)
-    db.execute.return_value = executor
-    table = AppleTable()
-
+def test_should_delete(
+    db: MagicMock, executor: MagicMock, table: AppleTable, apple: Apple
+) -> None:
     MsSqlRepository[Apple](db, table).delete(apple.id)
 
     db.execute.assert_called_once_with(table.delete(apple.id))
     executor.fetch_none.assert_called_once()
 
 
-def test_should_delete_all() -> None:
-    db = MagicMock(spec=Database)
-    executor = MagicMock(spec=Database._CommandExecutor)
-    db.execute.return_value = executor
-    table = AppleTable()
-
+def test_should_delete_all(
+    db: MagicMock, executor: MagicMock, table: AppleTable
+) -> None:
     MsSqlRepository[Apple](db, table).delete_all()
 
     db.execute.assert_called_once_with(table.delete_all())
     executor.fetch_none.assert_called_once()
 
 
-def test_should_create(apple: Apple) -> None:
-    db = MagicMock(spec=Database)
-    executor = MagicMock(spec=Database._CommandExecutor)
-    db.execute.return_value = executor
-    table = AppleTable()
-
-    executor.fetch_one.return_value = AppleTable().dump(apple)
+def test_should_create(
+    db: MagicMock, executor: MagicMock, table: AppleTable, apple: Apple
+) -> None:
+    executor.fetch_one.return_value = table.dump(apple)
 
     result = MsSqlRepository[Apple](db, table).create(apple)
 
@@ -157,37 +157,24 @@ def test_should_create(apple: Apple) -> None:
     assert result == apple
 
 
-def test_should_not_duplicate(apple: Apple) -> None:
-    db = MagicMock(spec=Database)
-    executor = MagicMock(spec=Database._CommandExecutor)
-    db.execute.return_value = executor
-    table = AppleTable()
-
+def test_should_not_duplicate(db: MagicMock, table: AppleTable, apple: Apple) -> None:
     db.execute.side_effect = DatabaseError(2627, b"duplication")
 
     with pytest.raises(ExistsError):
         MsSqlRepository[Apple](db, table).create(apple)
 
 
-def test_should_not_create(apple: Apple) -> None:
-    db = MagicMock(spec=Database)
-    executor = MagicMock(spec=Database._CommandExecutor)
-    db.execute.return_value = executor
-    table = AppleTable()
-
+def test_should_not_create(db: MagicMock, table: AppleTable, apple: Apple) -> None:
     db.execute.side_effect = DatabaseError(0, b"error")
 
     with pytest.raises(UnknownError):
         MsSqlRepository[Apple](db, table).create(apple)
 
 
-def test_should_read(apple: Apple) -> None:
-    db = MagicMock(spec=Database)
-    executor = MagicMock(spec=Database._CommandExecutor)
-    db.execute.return_value = executor
-    table = AppleTable()
-
-    executor.fetch_one.return_value = AppleTable().dump(apple)
+def test_should_read(
+    db: MagicMock, executor: MagicMock, table: AppleTable, apple: Apple
+) -> None:
+    executor.fetch_one.return_value = table.dump(apple)
 
     result = MsSqlRepository[Apple](db, table).read(apple.id)
 
@@ -196,24 +183,18 @@ def test_should_read(apple: Apple) -> None:
     assert result == apple
 
 
-def test_should_not_read_unknown(apple: Apple) -> None:
-    db = MagicMock(spec=Database)
-    executor = MagicMock(spec=Database._CommandExecutor)
-    db.execute.return_value = executor
-    table = AppleTable()
-
+def test_should_not_read_unknown(
+    db: MagicMock, executor: MagicMock, table: AppleTable, apple: Apple
+) -> None:
     executor.fetch_one.return_value = None
 
     with pytest.raises(DoesNotExistError):
         MsSqlRepository[Apple](db, table).read(apple.id)
 
 
-def test_should_update(apple: Apple) -> None:
-    db = MagicMock(spec=Database)
-    executor = MagicMock(spec=Database._CommandExecutor)
-    db.execute.return_value = executor
-    table = AppleTable()
-
+def test_should_update(
+    db: MagicMock, executor: MagicMock, table: AppleTable, apple: Apple
+) -> None:
     MsSqlRepository[Apple](db, table).update(apple)
 
     db.execute.assert_called_once_with(table.update(apple))
@@ -12,7 +12,7 @@ from apexdevkit.repository.mssql import (
 from apexdevkit.repository.sql import NotNone, SqlFieldBuilder
 
 
-@dataclass
+@dataclass(slots=True)
 class Apple:
     color: str
     parent: str | None
@@ -20,7 +20,7 @@ class Apple:
     id: str = field(default_factory=lambda: str(uuid4()))
 
 
-@dataclass
+@dataclass(slots=True)
 class AppleFormatter:
     def dump(self, data: Apple) -> dict[str, Any]:
         return {"apid": data.id, "clr": data.color, "pid": data.parent}
@@ -29,7 +29,7 @@ class AppleFormatter:
         return Apple(raw["clr"], raw["pid"], raw["apid"])
 
 
-@fixture
+@fixture(scope="module")
 def table() -> SqlTable[Apple]:
     return (
         MsSqlTableBuilder()
@@ -54,7 +54,7 @@ def table() -> SqlTable[Apple]:
     )
 
 
-@fixture()
+@fixture(scope="module")
 def table_with_parent() -> SqlTable[Apple]:
     return (
         MsSqlTableBuilder()
@@ -73,11 +73,16 @@ def table_with_parent() -> SqlTable[Apple]:
     )
 
 
-@fixture
+@fixture(scope="module")
 def apple() -> Apple:
     return Apple("red", "1", "1")
 
 
+@fixture(scope="module")
+def dumped_apple(apple: Apple) -> dict[str, Any]:
+    return AppleFormatter().dump(apple)
+
+
 def test_should_count(table: SqlTable[Apple]) -> None:
     command = table.count_all()
     assert command == DatabaseCommand(
@@ -91,7 +96,9 @@ def test_should_count(table: SqlTable[Apple]) -> None:
     ).with_data(kingdom="fruits", manager=None)
 
 
-def test_should_insert(table: SqlTable[Apple], apple: Apple) -> None:
+def test_should_insert(
+    table: SqlTable[Apple], apple: Apple, dumped_apple: dict[str, Any]
+) -> None:
     command = table.insert(apple)
     assert command == DatabaseCommand(
         """
@@ -111,7 +118,7 @@ def test_should_insert(table: SqlTable[Apple], apple: Apple) -> None:
             
             REVERT
         """
-    ).with_data(kingdom="fruits", manager=None, **AppleFormatter().dump(apple))
+    ).with_data(kingdom="fruits", manager=None, **dumped_apple)
 
 
 def test_should_select(table: SqlTable[Apple], apple: Apple) -> None:
@@ -143,7 +150,9 @@ def test_should_select_all(table: SqlTable[Apple]) -> None:
     ).with_data(kingdom="fruits", manager=None)
 
 
-def test_should_update(table: SqlTable[Apple], apple: Apple) -> None:
+def test_should_update(
+    table: SqlTable[Apple], apple: Apple, dumped_apple: dict[str, Any]
+) -> None:
     command = table.update(apple)
     assert command == DatabaseCommand(
         """
@@ -155,7 +164,7 @@ def test_should_update(table: SqlTable[Apple], apple: Apple) -> None:
             WHERE [apid] = %(apid)s AND [manager] IS NOT NULL
             REVERT
         """
-    ).with_data(kingdom="fruits", manager=None, **AppleFormatter().dump(apple))
+    ).with_data(kingdom="fruits", manager=None, **dumped_apple)
 
 
 def test_should_delete(table: SqlTable[Apple], apple: Apple) -> None:
@@ -198,11 +207,9 @@ def test_should_count_with_parent(table_with_parent: SqlTable[Apple]) -> None:
 
 
 def test_should_insert_with_parent(
-    table_with_parent: SqlTable[Apple], apple: Apple
+    table_with_parent: SqlTable[Apple], apple: Apple, dumped_apple: dict[str, Any]
 ) -> None:
     command = table_with_parent.insert(apple)
-    dumped = AppleFormatter().dump(apple)
-    dumped["pid"] = "test"
 
     assert command == DatabaseCommand(
         """
@@ -221,7 +228,7 @@ def test_should_insert_with_parent(
             
             REVERT
         """
-    ).with_data(dumped)
+    ).with_data(dumped_apple, pid="test")
 
 
 def test_should_select_with_parent(
@@ -256,11 +263,9 @@ def test_should_select_all_with_parent(table_with_parent: SqlTable[Apple]) -> No
 
 
 def test_should_update_with_parent(
-    table_with_parent: SqlTable[Apple], apple: Apple
+    table_with_parent: SqlTable[Apple], apple: Apple, dumped_apple: dict[str, Any]
 ) -> None:
     command = table_with_parent.update(apple)
-    dumped = AppleFormatter().dump(apple)
-    dumped["pid"] = "test"
 
     assert command == DatabaseCommand(
         """
@@ -271,7 +276,7 @@ def test_should_update_with_parent(
             WHERE [pid] = %(pid)s AND [apid] = %(apid)s
             REVERT
         """
-    ).with_data(dumped)
+    ).with_data(dumped_apple, pid="test")
 
 
 def test_should_delete_with_parent(
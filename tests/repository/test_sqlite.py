@@ -1,6 +1,6 @@
 from dataclasses import dataclass
-from typing import Any
-from uuid import uuid4
+from itertools import count
+from typing import Any, Iterator
 
 from pytest import fixture, raises
 
@@ -13,54 +13,71 @@ from apexdevkit.repository.interface import BatchRepository
 from apexdevkit.repository.sqlite import SqliteRepository, SqlTable
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class _Item:
     id: str
     external_id: str
 
 
+_FORMATTER = DataclassFormatter[_Item](_Item)
+_IDS = count()
+
+
+def _next_id() -> str:
+    return f"id-{next(_IDS)}"
+
+
 class FakeTable(SqlTable[_Item]):
-    def setup(self) -> DatabaseCommand:
-        return DatabaseCommand("""
-            CREATE TABLE IF NOT EXISTS ITEM (
-                id              TEXT        NOT NULL    PRIMARY KEY,
-                external_id     TEXT        NOT NULL,
+    SETUP = DatabaseCommand("""
+        CREATE TABLE IF NOT EXISTS ITEM (
+            id              TEXT        NOT NULL    PRIMARY KEY,
+            external_id     TEXT        NOT NULL,
+
+            UNIQUE(id)
+        );
+    """)
+    COUNT_ALL = DatabaseCommand("SELECT COUNT(*) as n_items FROM ITEM;")
+    SELECT_ALL = DatabaseCommand("SELECT * FROM ITEM ORDER BY rowid;")
+    SELECT = DatabaseCommand("SELECT * FROM ITEM WHERE id=:id")
+    INSERT = DatabaseCommand("""
+        INSERT INTO ITEM (id, external_id) VALUES (:id, :external_id)
+        RETURNING id, external_id;
+    """)
+    UPDATE = DatabaseCommand("""
+        UPDATE ITEM SET id=:id, external_id=:external_id WHERE id=:id;
+    """)
+    DELETE = DatabaseCommand("DELETE FROM ITEM WHERE id=:id")
+    DELETE_ALL = DatabaseCommand("DELETE FROM ITEM")
 
-                UNIQUE(id)
-            );
-        """)
+    def setup(self) -> DatabaseCommand:
+        return self.SETUP
 
     def count_all(self) -> DatabaseCommand:
-        return DatabaseCommand("SELECT COUNT(*) as n_items FROM ITEM;")
+        return self.COUNT_ALL
 
     def select_all(self) -> DatabaseCommand:
-        return DatabaseCommand("SELECT * FROM ITEM;")
+        return self.SELECT_ALL
 
     def select(self, item_id: str) -> DatabaseCommand:
-        return DatabaseCommand("SELECT * FROM ITEM WHERE id=:id").with_data(id=item_id)
+        return self.SELECT.with_data(id=item_id)
 
     def select_duplicate(self, item: _Item) -> DatabaseCommand:
         return self.select(item.id)
 
     def insert(self, item: _Item) -> DatabaseCommand:
-        return DatabaseCommand("""
-            INSERT INTO ITEM (id, external_id) VALUES (:id, :external_id)
-            RETURNING id, external_id;
-        """).with_data(DataclassFormatter[_Item](_Item).dump(item))
+        return self.INSERT.with_data(_FORMATTER.dump(item))
 
     def update(self, item: _Item) -> DatabaseCommand:
-        return DatabaseCommand("""
-            UPDATE ITEM SET id=:id, external_id=:external_id WHERE id=:id;
-        """).with_data(DataclassFormatter[_Item](_Item).dump(item))
+        return self.UPDATE.with_data(_FORMATTER.dump(item))
 
     def delete(self, item_id: str) -> DatabaseCommand:
-        return DatabaseCommand("DELETE FROM ITEM WHERE id=:id").with_data(id=item_id)
+        return self.DELETE.with_data(id=item_id)
 
     def delete_all(self) -> DatabaseCommand:
-        return DatabaseCommand("DELETE FROM ITEM")
+        return self.DELETE_ALL
 
     def load(self, data: dict[str, Any]) -> _Item:
-        return DataclassFormatter[_Item](_Item).load(data)
+        return _FORMATTER.load(data)
 
     def duplicate(self, item: _Item) -> ExistsError:
         return ExistsError(item).with_duplicate(
@@ -68,18 +85,25 @@ class FakeTable(SqlTable[_Item]):
         )
 
 
-@fixture
-def repository() -> BatchRepository[_Item]:
+@fixture(scope="module")
+def db() -> Database:
     db = Database(SqliteInMemoryConnector())
     db.execute(FakeTable().setup()).fetch_none()
 
-    return BatchRepositoryDecorator(
+    return db
+
+
+@fixture
+def repository(db: Database) -> Iterator[BatchRepository[_Item]]:
+    yield BatchRepositoryDecorator(
         SqliteRepository[_Item](
             table=FakeTable(),
             db=db,
         )
     )
 
+    db.execute(FakeTable().delete_all()).fetch_none()
+
 
 def test_should_list_nothing_when_empty(repository: BatchRepository[_Item]) -> None:
     assert len(repository) == 0
@@ -88,17 +112,17 @@ def test_should_list_nothing_when_empty(repository: BatchRepository[_Item]) -> N
 
 def test_should_not_read_unknown(repository: BatchRepository[_Item]) -> None:
     with raises(DoesNotExistError):
-        repository.read(str(uuid4()))
+        repository.read(_next_id())
 
 
 def test_should_create(repository: BatchRepository[_Item]) -> None:
-    item = _Item(id=str(uuid4()), external_id=str(uuid4()))
+    item = _Item(id=_next_id(), external_id=_next_id())
 
     assert repository.create(item) == item
 
 
 def test_should_not_duplicate_on_create(repository: BatchRepository[_Item]) -> None:
-    item = _Item(id=str(uuid4()), external_id=str(uuid4()))
+    item = _Item(id=_next_id(), external_id=_next_id())
     repository.create(item)
 
     with raises(ExistsError, match=f"_Item with id<{item.id}> already exists."):
@@ -107,8 +131,8 @@ def test_should_not_duplicate_on_create(repository: BatchRepository[_Item]) -> N
 
 def test_should_create_many(repository: BatchRepository[_Item]) -> None:
     items = [
-        _Item(id=str(uuid4()), external_id=str(uuid4())),
-        _Item(id=str(uuid4()), external_id=str(uuid4())),
+        _Item(id=_next_id(), external_id=_next_id()),
+        _Item(id=_next_id(), external_id=_next_id()),
     ]
 
     assert repository.create_many(items) == items
@@ -118,8 +142,8 @@ def test_should_not_duplicate_on_create_many(
     repository: BatchRepository[_Item],
 ) -> None:
     items = [
-        _Item(id=str(uuid4()), external_id=str(uuid4())),
-        _Item(id=str(uuid4()), external_id=str(uuid4())),
+        _Item(id=_next_id(), external_id=_next_id()),
+        _Item(id=_next_id(), external_id=_next_id()),
     ]
     repository.create(items[1])
 
@@ -128,7 +152,7 @@ def test_should_not_duplicate_on_create_many(
 
 
 def test_should_persist(repository: BatchRepository[_Item]) -> None:
-    item = _Item(id=str(uuid4()), external_id=str(uuid4()))
+    item = _Item(id=_next_id(), external_id=_next_id())
     repository.create(item)
 
     assert len(repository) == 1
@@ -137,8 +161,8 @@ def test_should_persist(repository: BatchRepository[_Item]) -> None:
 
 def test_should_persist_many(repository: BatchRepository[_Item]) -> None:
     items = [
-        _Item(id=str(uuid4()), external_id=str(uuid4())),
-        _Item(id=str(uuid4()), external_id=str(uuid4())),
+        _Item(id=_next_id(), external_id=_next_id()),
+        _Item(id=_next_id(), external_id=_next_id()),
     ]
     repository.create_many(items)
 
@@ -147,10 +171,10 @@ def test_should_persist_many(repository: BatchRepository[_Item]) -> None:
 
 
 def test_should_persist_update(repository: BatchRepository[_Item]) -> None:
-    old_item = _Item(id=str(uuid4()), external_id=str(uuid4()))
+    old_item = _Item(id=_next_id(), external_id=_next_id())
     repository.create(old_item)
 
-    item = _Item(id=old_item.id, external_id=str(uuid4()))
+    item = _Item(id=old_item.id, external_id=_next_id())
     repository.update(item)
 
     assert repository.read(item.id) == item
@@ -158,14 +182,14 @@ def test_should_persist_update(repository: BatchRepository[_Item]) -> None:
 
 def test_should_persist_update_many(repository: BatchRepository[_Item]) -> None:
     old_items = [
-        _Item(id=str(uuid4()), external_id=str(uuid4())),
-        _Item(id=str(uuid4()), external_id=str(uuid4())),
+        _Item(id=_next_id(), external_id=_next_id()),
+        _Item(id=_next_id(), external_id=_next_id()),
     ]
     repository.create_many(old_items)
 
     items = [
-        _Item(id=old_items[0].id, external_id=str(uuid4())),
-        _Item(id=old_items[1].id, external_id=str(uuid4())),
+        _Item(id=old_items[0].id, external_id=_next_id()),
+        _Item(id=old_items[1].id, external_id=_next_id()),
     ]
     repository.update_many(items)
 
@@ -174,8 +198,8 @@ def test_should_persist_update_many(repository: BatchRepository[_Item]) -> None:
 
 def test_should_persist_delete(repository: BatchRepository[_Item]) -> None:
     items = [
-        _Item(id=str(uuid4()), external_id=str(uuid4())),
-        _Item(id=str(uuid4()), external_id=str(uuid4())),
+        _Item(id=_next_id(), external_id=_next_id()),
+        _Item(id=_next_id(), external_id=_next_id()),
     ]
     repository.create_many(items)
 
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from uuid import uuid4
+from typing import Iterator
 
 from _pytest.fixtures import fixture
 from _pytest.python_api import raises
@@ -15,7 +15,7 @@ from apexdevkit.repository.sqlite import (
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _Item:
     id: str
 
@@ -25,23 +25,22 @@ class _Item:
     parent: int | None = None
 
 
-def setup() -> DatabaseCommand:
-    return DatabaseCommand("""
-        CREATE TABLE IF NOT EXISTS ITEM (
-            id              TEXT        NOT NULL    PRIMARY KEY,
-            name            TEXT        NOT NULL,
-            count           INT         NOT NULL,
-            parent          INT         NOT NULL,
-            fixed           INT         NOT NULL,
+_SETUP = DatabaseCommand("""
+    CREATE TABLE IF NOT EXISTS ITEM (
+        id              TEXT        NOT NULL    PRIMARY KEY,
+        name            TEXT        NOT NULL,
+        count           INT         NOT NULL,
+        parent          INT         NOT NULL,
+        fixed           INT         NOT NULL,
 
-            UNIQUE(id)
-        );
-    """)
+        UNIQUE(id)
+    );
+""")
 
 
 @fixture
 def item() -> _Item:
-    return _Item(str(uuid4()), "item", 1)
+    return _Item("item-id", "item", 1)
 
 
 @fixture
@@ -49,12 +48,17 @@ def item_with_parent(item: _Item) -> _Item:
     return _Item(item.id, "item", 1, 0)
 
 
-@fixture
-def repository() -> SqliteRepository[_Item]:
+@fixture(scope="module")
+def db() -> Database:
     db = Database(SqliteInMemoryConnector())
-    db.execute(setup()).fetch_none()
+    db.execute(_SETUP).fetch_none()
+
+    return db
+
 
-    return SqliteRepository[_Item](
+@fixture
+def repository(db: Database) -> Iterator[SqliteRepository[_Item]]:
+    repository = SqliteRepository[_Item](
         table=SqliteTableBuilder[_Item]()
         .with_name("item")
         .with_formatter(DataclassFormatter(_Item))
@@ -71,6 +75,10 @@ def repository() -> SqliteRepository[_Item]:
         db=db,
     )
 
+    yield repository
+
+    db.execute(DatabaseCommand("DELETE FROM ITEM")).fetch_none()
+
 
 def test_should_list_nothing_when_empty(repository: SqliteRepository[_Item]) -> None:
     assert len(repository) == 0
@@ -79,7 +87,7 @@ def test_should_list_nothing_when_empty(repository: SqliteRepository[_Item]) ->
 
 def test_should_not_read_unknown(repository: SqliteRepository[_Item]) -> None:
     with raises(DoesNotExistError):
-        repository.read(str(uuid4()))
+        repository.read("unknown-id")
 
 
 def test_should_create(